@@ -16,6 +16,7 @@ Expectation value class
 from __future__ import annotations
 
 from collections.abc import Sequence
+from functools import lru_cache
 from itertools import accumulate
 
 import numpy as np
@@ -407,25 +408,136 @@ class BackendEstimator(BaseEstimator[PrimitiveJob[EstimatorResult]]):
             return output
 
 
-def _paulis2inds(paulis: PauliList) -> list[int]:
+def _bits_to_uint64(bits: np.ndarray) -> np.ndarray:
+    """Convert the rows of a 2D array of bits to ``uint64`` integers.
+
+    The ``j``-th column of ``bits`` corresponds to the coefficient ``2^j``, and there must be at
+    most 64 columns.
+    """
+    packed_vals = np.packbits(bits, axis=1, bitorder="little")
+    # the packed bytes of each row are the low bytes of a single little-endian uint64
+    words = np.zeros((packed_vals.shape[0], 8), dtype=np.uint8)
+    words[:, : packed_vals.shape[1]] = packed_vals
+    return words.view("<u8").ravel().astype(np.uint64, copy=False)
+
+
+def _paulis2inds(paulis: PauliList) -> np.ndarray:
     """Convert PauliList to diagonal integers.
     These are integer representations of the binary string with a
     1 where there are Paulis, and 0 where there are identities.
+
+    The integers are returned as an array of ``uint64`` if the Paulis act on at most 64 qubits,
+    and as an array of Python integers otherwise.
     """
     # Treat Z, X, Y the same
     nonid = paulis.z | paulis.x
 
+    if paulis.num_qubits <= 64:
+        return _bits_to_uint64(nonid)
+
     # bits are packed into uint8 in little endian
     # e.g., i-th bit corresponds to coefficient 2^i
     packed_vals = np.packbits(nonid, axis=1, bitorder="little")
-    power_uint8 = 1 << (8 * np.arange(packed_vals.shape[1], dtype=object))
-    inds = packed_vals @ power_uint8
-    return inds.tolist()
+    return packed_vals @ _pow_uint8(packed_vals.shape[1])
+
+
+@lru_cache(maxsize=None)
+def _pow_uint8(nbytes: int) -> np.ndarray:
+    """Return the coefficients ``2^(8i)`` of the bytes of an integer of ``nbytes`` bytes as Python
+    integers. The returned array is shared and must not be modified.
+    """
+    power_uint8 = 1 << (8 * np.arange(nbytes, dtype=object))
+    power_uint8.flags.writeable = False
+    return power_uint8
+
+
+if hasattr(int, "bit_count"):
+
+    def _parity(integer: int) -> int:
+        """Return the parity of an integer"""
+        return integer.bit_count() & 1
+
+else:  # int.bit_count is only available from Python 3.10
+
+    def _parity(integer: int) -> int:
+        """Return the parity of an integer"""
+        return bin(integer).count("1") % 2
 
 
-def _parity(integer: int) -> int:
-    """Return the parity of an integer"""
-    return bin(integer).count("1") % 2
+_EXPVAL_BLOCK_SIZE = 1 << 18
+"""The maximum number of (outcome, Pauli) pairs evaluated at once by
+:func:`_pauli_expval_with_variance_batch`."""
+
+_EXPVAL_LOOP_SIZE = 32
+"""The maximum number of (outcome, Pauli) pairs of a single counts dict evaluated with a Python
+loop by :func:`_pauli_expval_with_variance`, below which the loop is faster than NumPy."""
+
+
+def _parity_uint64(values: np.ndarray) -> np.ndarray:
+    """Return the parity of each element of an array of ``uint64`` integers.
+
+    The bits of each element are folded onto the lowest bit with a sequence of shifts and
+    XORs, so the parity of the whole array is computed with a handful of vectorized operations.
+    Note that the input array is modified in place.
+    """
+    for shift in (32, 16, 8, 4, 2, 1):
+        values ^= values >> np.uint64(shift)
+    return values & np.uint64(1)
+
+
+def _outcomes_to_ints(counts: Counts) -> list[int]:
+    """Return the outcomes of the leftmost classical register of the counts as integers."""
+    return [
+        int(bin_outcome.split(" ", 1)[0] if " " in bin_outcome else bin_outcome, 2)
+        for bin_outcome in counts
+    ]
+
+
+def _outcomes_to_uint64(counts: Counts, num_qubits: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the outcomes of the leftmost classical register of the counts as ``uint64``, and
+    their frequencies.
+
+    Only the lowest ``num_qubits`` bits of the outcomes can overlap with the diagonal indices of
+    Paulis on ``num_qubits`` qubits, so the outcomes are truncated to those bits without changing
+    any parity. ``num_qubits`` must be at most 64.
+    """
+    mask = (1 << num_qubits) - 1
+
+    if isinstance(counts, Counts) and counts.int_raw:
+        # the integer outcomes span all the registers, the leftmost of which holds the top bits
+        int_raw = counts.int_raw
+        shift = 0
+        if counts.creg_sizes and counts.memory_slots:
+            shift = counts.memory_slots - counts.creg_sizes[-1][1]
+        if counts.memory_slots is not None and counts.memory_slots <= 64:
+            outcomes = np.fromiter(int_raw, dtype=np.uint64, count=len(int_raw))
+            outcomes = (outcomes >> np.uint64(shift)) & np.uint64(mask)
+        else:
+            outcomes = np.fromiter(
+                ((outcome >> shift) & mask for outcome in int_raw),
+                dtype=np.uint64,
+                count=len(int_raw),
+            )
+        return outcomes, np.fromiter(int_raw.values(), dtype=float, count=len(int_raw))
+
+    freqs = np.fromiter(counts.values(), dtype=float, count=len(counts))
+    keys = [bin_outcome.split(" ", 1)[0] for bin_outcome in counts]
+    if keys:
+        width = len(keys[0])
+        if width and all(len(key) == width for key in keys):
+            # all the outcomes are bitstrings of the same width, so parse them all at once
+            chars = "".join(keys).encode()
+            bits = np.frombuffer(chars, dtype=np.uint8).reshape(len(keys), width) - ord("0")
+            if np.all(bits <= 1):
+                # reverse the columns so that the j-th column is the coefficient 2^j
+                return _bits_to_uint64(bits[:, : -num_qubits - 1 : -1]), freqs
+
+    outcomes = np.fromiter(
+        (outcome & mask for outcome in _outcomes_to_ints(counts)),
+        dtype=np.uint64,
+        count=len(counts),
+    )
+    return outcomes, freqs
 
 
 def _pauli_expval_with_variance(counts: Counts, paulis: PauliList) -> tuple[np.ndarray, np.ndarray]:
@@ -434,19 +546,20 @@ def _pauli_expval_with_variance(counts: Counts, paulis: PauliList) -> tuple[np.n
     that basis rotations have been applied to convert them to the
     diagonal basis.
     """
-    # Diag indices
     size = len(paulis)
-    diag_inds = _paulis2inds(paulis)
+    if paulis.num_qubits <= 64 and len(counts) * size > _EXPVAL_LOOP_SIZE:
+        return _pauli_expval_with_variance_uint64(counts, paulis)
+
+    # Diag indices
+    diag_inds = _paulis2inds(paulis).tolist()
 
     expvals = np.zeros(size, dtype=float)
     denom = 0  # Total shots for counts dict
-    for bin_outcome, freq in counts.items():
-        split_outcome = bin_outcome.split(" ", 1)[0] if " " in bin_outcome else bin_outcome
-        outcome = int(split_outcome, 2)
+    parity = _parity
+    for outcome, freq in zip(_outcomes_to_ints(counts), counts.values()):
         denom += freq
-        for k in range(size):
-            coeff = (-1) ** _parity(diag_inds[k] & outcome)
-            expvals[k] += freq * coeff
+        for k, diag_ind in enumerate(diag_inds):
+            expvals[k] += -freq if parity(diag_ind & outcome) else freq
 
     # Divide by total shots
     expvals /= denom
@@ -456,6 +569,92 @@ def _pauli_expval_with_variance(counts: Counts, paulis: PauliList) -> tuple[np.n
     return expvals, variances
 
 
+def _pauli_expval_with_variance_uint64(
+    counts: Counts, paulis: PauliList
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return array of expval and variance pairs for input Paulis on at most 64 qubits.
+
+    The parities of the outcomes and the diagonal indices are computed with vectorized ``uint64``
+    operations, in blocks of at most about ``_EXPVAL_BLOCK_SIZE`` elements.
+    """
+    # Diag indices
+    diag_inds = _paulis2inds(paulis)
+    outcomes, freqs = _outcomes_to_uint64(counts, paulis.num_qubits)
+
+    expvals = np.zeros(len(paulis), dtype=float)
+    block_size = max(1, _EXPVAL_BLOCK_SIZE // max(1, len(paulis)))
+    for start in range(0, len(outcomes), block_size):
+        block = slice(start, start + block_size)
+        parities = _parity_uint64(outcomes[block, None] & diag_inds)
+        expvals += freqs[block] @ (1.0 - 2.0 * parities)
+
+    # Divide by total shots
+    expvals /= freqs.sum()
+
+    # Compute variance
+    variances = 1 - expvals**2
+    return expvals, variances
+
+
+def _pauli_expval_with_variance_batch(
+    counts: Sequence[Counts], paulis: Sequence[PauliList]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return arrays of expval and variance pairs for a batch of counts and input Paulis.
+
+    Row ``i`` of the returned arrays is the result of
+    ``_pauli_expval_with_variance(counts[i], paulis[i])``. All the Pauli lists must have the same
+    length and act on the same number of qubits, which must be at most 64. The outcomes of all
+    the counts are concatenated and evaluated with vectorized parity computations followed by a
+    segmented sum over each counts dict. The outcomes are processed in blocks so that the
+    intermediate arrays hold at most about ``_EXPVAL_BLOCK_SIZE`` elements.
+    """
+    num_qubits = paulis[0].num_qubits
+    # the same Pauli lists are typically measured in many counts, e.g. at every binding of a pub,
+    # so the diag indices of each distinct list are only computed once
+    pauli_rows: dict[int, int] = {}
+    unique_inds = []
+    rows = []
+    for pauli_list in paulis:
+        row = pauli_rows.get(id(pauli_list))
+        if row is None:
+            row = pauli_rows[id(pauli_list)] = len(unique_inds)
+            unique_inds.append(_paulis2inds(pauli_list))
+        rows.append(row)
+    # Diag indices, with shape (num_distinct_paulis, num_paulis)
+    diag_inds = np.stack(unique_inds)
+    rows = np.array(rows, dtype=np.intp)
+
+    outcomes, freqs = zip(*(_outcomes_to_uint64(count, num_qubits) for count in counts))
+    count_ids = np.repeat(
+        np.arange(len(counts)), [len(count_outcomes) for count_outcomes in outcomes]
+    )
+    outcomes = np.concatenate(outcomes)
+    freqs = np.concatenate(freqs)
+
+    expvals = np.zeros((len(counts), diag_inds.shape[1]), dtype=float)
+    block_size = max(1, _EXPVAL_BLOCK_SIZE // max(1, diag_inds.shape[1]))
+    for start in range(0, len(outcomes), block_size):
+        block = slice(start, start + block_size)
+        block_ids = count_ids[block]
+        # signs of each (outcome, pauli) pair weighted by the frequency of the outcome
+        parities = _parity_uint64(diag_inds[rows[block_ids]] & outcomes[block, None])
+        weighted_signs = (1.0 - 2.0 * parities) * freqs[block, None]
+        # the outcomes of each counts dict are contiguous, so sum over the segments of the block
+        # belonging to the same counts dict. A counts dict can span several blocks.
+        seg_starts = np.flatnonzero(np.diff(block_ids, prepend=-1))
+        expvals[block_ids[seg_starts]] += np.add.reduceat(weighted_signs, seg_starts, axis=0)
+
+    # Total shots for each counts dict
+    denoms = np.bincount(count_ids, weights=freqs, minlength=len(counts))
+
+    # Divide by total shots
+    expvals /= denoms[:, None]
+
+    # Compute variance
+    variances = 1 - expvals**2
+    return expvals, variances
+
+
 def _passmanager_for_measurement_circuits(layout, backend) -> PassManager:
     passmanager = PassManager([SetLayout(layout)])
     if isinstance(backend, BackendV2):
@@ -15,9 +15,11 @@
 from __future__ import annotations
 
 import math
-from collections import defaultdict
-from collections.abc import Iterable
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 
 import numpy as np
 
@@ -28,14 +30,25 @@ from qiskit.quantum_info import Pauli, PauliList
 from qiskit.result import Counts
 from qiskit.transpiler import PassManager, PassManagerConfig
 from qiskit.transpiler.passes import Optimize1qGatesDecomposition
-
-from .backend_estimator import _pauli_expval_with_variance, _prepare_counts, _run_circuits
+from qiskit.utils.parallel import CPU_COUNT, should_run_in_parallel
+
+from .backend_estimator import (
+    _pauli_expval_with_variance,
+    _pauli_expval_with_variance_batch,
+    _prepare_counts,
+    _run_circuits,
+)
 from .base import BaseEstimatorV2
 from .containers import DataBin, EstimatorPubLike, PrimitiveResult, PubResult
 from .containers.bindings_array import BindingsArray
 from .containers.estimator_pub import EstimatorPub
 from .primitive_job import PrimitiveJob
 
+# the maximum number of sets of Pauli terms whose measurement groups are cached by an estimator
+_GROUP_CACHE_SIZE = 1024
+# the maximum number of measurement bases whose unrolled circuits are cached by an estimator
+_MEAS_CACHE_SIZE = 1024
+
 
 @dataclass
 class Options:
@@ -56,20 +69,75 @@ class Options:
     Default: None.
     """
 
+    deduplicate_circuits: bool = False
+    """Whether identical circuits, from repeated parameter values of the same circuit, are only run
+    once. The expectation values computed from the same circuit are then estimated from the same
+    counts, so they are not independent estimates.
+    Default: False.
+    """
+
 
 @dataclass
 class _PreprocessedData:
     """Internal data structure to store the results of the preprocessing of a pub."""
 
-    circuits: list[QuantumCircuit]
-    """The quantum circuits generated by binding parameters of the pub's circuit."""
-
     parameter_indices: np.ndarray
-    """The indices of the pub's bindings array broadcast to the shape of the pub."""
+    """The flat indices of the pub's bindings array broadcast to the shape of the pub."""
 
     observables: np.ndarray
     """The pub's observable array broadcast to the shape of the pub."""
 
+    observable_ids: np.ndarray
+    """The indices of the Pauli terms of each observable in the pub's sorted Pauli terms,
+    broadcast to the shape of the pub."""
+
+    measurements: list[tuple[int, list[tuple]]]
+    """The flat indices of the pub's bindings array paired with the groups of Pauli terms
+    measured there, see :meth:`~.BackendEstimatorV2._group_paulis`."""
+
+    circuits: list[QuantumCircuit] = field(default_factory=list)
+    """The quantum circuits generated by binding parameters of the pub's circuit."""
+
+    circuit_keys: list[tuple | None] = field(default_factory=list)
+    """The keys identifying each circuit among those generated from the same circuit, or ``None``
+    if the circuits are not deduplicated."""
+
+    metadata: list[dict] = field(default_factory=list)
+    """The metadata of each measurement, including the index in :attr:`circuits` of the circuit
+    it is measured by."""
+
+
+class _LRUCache:
+    """Internal mapping which only keeps its ``maxsize`` most recently used items.
+
+    The pubs are preprocessed concurrently, so the accesses are guarded by a lock.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key):
+        """Return the value of a key and mark it as the most recently used, or ``None`` if the
+        key is not cached."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value) -> None:
+        """Add an item, evicting the least recently used one if the cache is full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
 
 class BackendEstimatorV2(BaseEstimatorV2):
     """Evaluates expectation values for provided quantum circuit and observable combinations
@@ -104,6 +172,11 @@ class BackendEstimatorV2(BaseEstimatorV2):
 
     * ``seed_simulator``: The seed to use in the simulator. If None, a random seed will be used.
       Default: None.
+
+    * ``deduplicate_circuits``: Whether identical circuits, from repeated parameter values of the
+      same circuit, are only run once. The expectation values computed from the same circuit are
+      then estimated from the same counts, so they are not independent estimates.
+      Default: False.
     """
 
     def __init__(
@@ -116,8 +189,9 @@ class BackendEstimatorV2(BaseEstimatorV2):
         Args:
             backend: The backend to run the primitive on.
             options: The options to control the default precision (``default_precision``),
-                the operator grouping (``abelian_grouping``), and
-                the random seed for the simulator (``seed_simulator``).
+                the operator grouping (``abelian_grouping``),
+                the random seed for the simulator (``seed_simulator``), and
+                the deduplication of circuits (``deduplicate_circuits``).
         """
         self._backend = backend
         self._options = Options(**options) if options else Options()
@@ -128,6 +202,11 @@ class BackendEstimatorV2(BaseEstimatorV2):
         else:
             opt1q = Optimize1qGatesDecomposition(basis=basis)
         self._passmanager = PassManager([opt1q])
+        # cache of the unrolled measurement circuit of each basis, keyed by
+        # ``(num_qubits, z bytes, x bytes)``
+        self._meas_cache = _LRUCache(_MEAS_CACHE_SIZE)
+        # cache of the measurement groups of each set of Pauli terms, see ``_group_paulis``
+        self._group_cache = _LRUCache(_GROUP_CACHE_SIZE)
 
     @property
     def options(self) -> Options:
@@ -176,58 +255,126 @@ class BackendEstimatorV2(BaseEstimatorV2):
 
     def _run_pubs(self, pubs: list[EstimatorPub], shots: int) -> list[PubResult]:
         """Compute results for pubs that all require the same value of ``shots``."""
-        preprocessed_data = []
-        flat_circuits = []
-        for pub in pubs:
-            data = self._preprocess_pub(pub)
-            preprocessed_data.append(data)
-            flat_circuits.extend(data.circuits)
-
-        run_result, metadata = _run_circuits(
-            flat_circuits, self._backend, shots=shots, seed_simulator=self._options.seed_simulator
+        preprocessed_data = _map_pubs(self._preprocess_pub, pubs)
+
+        # the measurement circuits of this run are held here, so that evicting them from the
+        # cache while the pubs are bound is harmless
+        meas_circuits: dict[tuple[int, bytes, bytes], QuantumCircuit] = {}
+        new_bases = {}
+        for data in preprocessed_data:
+            for _, groups in data.measurements:
+                for key, basis, _, _ in groups:
+                    if key not in meas_circuits and key not in new_bases:
+                        meas_circuit = self._meas_cache.get(key)
+                        if meas_circuit is None:
+                            new_bases[key] = basis
+                        else:
+                            meas_circuits[key] = meas_circuit
+        # build the measurement circuits of all the new bases at once. The pass manager is only
+        # run here since it is not safe to run it concurrently.
+        if new_bases:
+            meas_circuits.update(self._create_measurement_circuits(new_bases))
+
+        bound_circuits = _map_pubs(
+            lambda pub, data: self._bind_and_add_measurements(
+                pub.circuit, pub.parameter_values, data.measurements, meas_circuits
+            ),
+            pubs,
+            preprocessed_data,
+        )
+        for data, (circuits, circuit_keys, metadata) in zip(preprocessed_data, bound_circuits):
+            data.circuits, data.circuit_keys, data.metadata = circuits, circuit_keys, metadata
+
+        # deduplicated circuits, e.g. from repeated parameter values or pubs, are only run once
+        unique_circuits = []
+        circuit_ids = []
+        unique_ids: dict[tuple, int] = {}
+        for pub, data in zip(pubs, preprocessed_data):
+            pub_circuit_ids = []
+            for circuit, key in zip(data.circuits, data.circuit_keys):
+                if key is not None:
+                    # only compare the keys of circuits generated from the same pub circuit
+                    key = (id(pub.circuit), key)
+                if key is None or key not in unique_ids:
+                    if key is not None:
+                        unique_ids[key] = len(unique_circuits)
+                    pub_circuit_ids.append(len(unique_circuits))
+                    unique_circuits.append(circuit)
+                else:
+                    pub_circuit_ids.append(unique_ids[key])
+            circuit_ids.append(pub_circuit_ids)
+
+        run_result, _ = _run_circuits(
+            unique_circuits,
+            self._backend,
+            shots=shots,
+            seed_simulator=self._options.seed_simulator,
         )
+
         counts = _prepare_counts(run_result)
 
         results = []
-        start = 0
-        for pub, data in zip(pubs, preprocessed_data):
-            end = start + len(data.circuits)
-            expval_map = self._calc_expval_map(counts[start:end], metadata[start:end])
-            start = end
+        for pub, data, pub_circuit_ids in zip(pubs, preprocessed_data, circuit_ids):
+            pub_counts = [counts[pub_circuit_ids[meta["circuit_index"]]] for meta in data.metadata]
+            expval_map = self._calc_expval_map(pub_counts, data.metadata)
             results.append(self._postprocess_pub(pub, expval_map, data, shots))
         return results
 
     def _preprocess_pub(self, pub: EstimatorPub) -> _PreprocessedData:
-        """Converts a pub into a list of bound circuits necessary to estimate all its observables.
-
-        The circuits contain metadata explaining which bindings array index they are with respect to,
-        and which measurement basis they are measuring.
+        """Divides the Pauli terms of a pub into the groups measured at each parameter value set.
 
         Args:
             pub: The pub to preprocess.
 
         Returns:
-            The values ``(circuits, bc_param_ind, bc_obs)`` where ``circuits`` are the circuits to
-            execute on the backend, ``bc_param_ind`` are indices of the pub's bindings array and
-            ``bc_obs`` is the observables array, both broadcast to the shape of the pub.
+            The values ``(bc_param_ind, bc_obs, bc_obs_ids, measurements)`` where
+            ``bc_param_ind`` are flat indices of the pub's bindings array, ``bc_obs`` is the
+            observables array and ``bc_obs_ids`` are the indices of the terms of each observable
+            in the pub's sorted Pauli terms, all broadcast to the shape of the pub, and
+            ``measurements`` are the groups of Pauli terms measured at each flat index. The
+            circuits are added by :meth:`_bind_and_add_measurements`.
         """
-        circuit = pub.circuit
         observables = pub.observables
         parameter_values = pub.parameter_values
 
         # calculate broadcasting of parameters and observables
         param_shape = parameter_values.shape
-        param_indices = np.fromiter(np.ndindex(param_shape), dtype=object).reshape(param_shape)
+        param_indices = np.arange(parameter_values.size).reshape(param_shape)
         bc_param_ind, bc_obs = np.broadcast_arrays(param_indices, observables)
 
+        # identify the Pauli terms of the pub by their position in the sorted labels, so that only
+        # integers are hashed when collecting the terms of each parameter value set
+        obs_list = observables.ravel().tolist()
+        pauli_labels = sorted(set().union(*obs_list))
+        label_ids = {label: i for i, label in enumerate(pauli_labels)}
+        obs_ids = np.empty(len(obs_list), dtype=object)
+        for i, obs in enumerate(obs_list):
+            obs_ids[i] = [label_ids[label] for label in obs]
+        bc_obs_ids = np.broadcast_to(obs_ids.reshape(observables.shape), bc_param_ind.shape)
+
         # calculate expectation values for each pair of parameter value set and pauli
         param_obs_map = defaultdict(set)
-        for index in np.ndindex(*bc_param_ind.shape):
-            param_index = bc_param_ind[index]
-            param_obs_map[param_index].update(bc_obs[index])
-
-        bound_circuits = self._bind_and_add_measurements(circuit, parameter_values, param_obs_map)
-        return _PreprocessedData(bound_circuits, bc_param_ind, bc_obs)
+        for param_index, pauli_ids in zip(bc_param_ind.ravel().tolist(), bc_obs_ids.ravel()):
+            param_obs_map[param_index].update(pauli_ids)
+
+        paulis = PauliList(pauli_labels)
+        num_qubits = pub.circuit.num_qubits
+        # the groups of the parameter value sets measuring the same Pauli terms are shared
+        pub_groups: dict[bytes, list] = {}
+        measurements = []
+        for param_index, pauli_ids in param_obs_map.items():
+            # sort pauli_ids, which sorts the labels, so that the order is deterministic
+            pauli_ids = np.sort(np.fromiter(pauli_ids, dtype=np.intp, count=len(pauli_ids)))
+            ids_key = pauli_ids.tobytes()
+            if ids_key not in pub_groups:
+                pub_groups[ids_key] = [
+                    (key, basis, pauli_ids[positions], meas_paulis)
+                    for key, basis, positions, meas_paulis in self._group_paulis(
+                        num_qubits, paulis[pauli_ids]
+                    )
+                ]
+            measurements.append((param_index, pub_groups[ids_key]))
+        return _PreprocessedData(bc_param_ind, bc_obs, bc_obs_ids, measurements)
 
     def _postprocess_pub(
         self, pub: EstimatorPub, expval_map: dict, data: _PreprocessedData, shots: int
@@ -245,17 +392,30 @@ class BackendEstimatorV2(BaseEstimatorV2):
         Returns:
             The pub result.
         """
+        from scipy.sparse import csr_matrix
+
         bc_param_ind = data.parameter_indices
         bc_obs = data.observables
-        evs = np.zeros_like(bc_param_ind, dtype=float)
-        variances = np.zeros_like(bc_param_ind, dtype=float)
-        for index in np.ndindex(*bc_param_ind.shape):
-            param_index = bc_param_ind[index]
-            for pauli, coeff in bc_obs[index].items():
-                expval, variance = expval_map[param_index, pauli]
-                evs[index] += expval * coeff
-                variances[index] += variance * coeff**2
-        stds = np.sqrt(variances / shots)
+        key_ids = {key: i for i, key in enumerate(expval_map)}
+        expvals = np.fromiter((expval for expval, _ in expval_map.values()), dtype=float)
+        variances = np.fromiter((variance for _, variance in expval_map.values()), dtype=float)
+
+        # sparse matrix of the coefficients of each pauli term in each element of the pub
+        rows, cols, coeffs = [], [], []
+        for index, (param_index, observable, pauli_ids) in enumerate(
+            zip(bc_param_ind.ravel().tolist(), bc_obs.ravel(), data.observable_ids.ravel())
+        ):
+            for pauli_id, coeff in zip(pauli_ids, observable.values()):
+                rows.append(index)
+                cols.append(key_ids[param_index, pauli_id])
+                coeffs.append(coeff)
+        coeff_matrix = csr_matrix(
+            (coeffs, (rows, cols)), shape=(bc_param_ind.size, len(key_ids)), dtype=float
+        )
+
+        evs = (coeff_matrix @ expvals).reshape(bc_param_ind.shape)
+        variances = coeff_matrix.multiply(coeff_matrix) @ variances
+        stds = np.sqrt(variances / shots).reshape(bc_param_ind.shape)
         data_bin = DataBin(evs=evs, stds=stds, shape=evs.shape)
         return PubResult(data_bin, metadata={"target_precision": pub.precision})
 
@@ -263,38 +423,98 @@ class BackendEstimatorV2(BaseEstimatorV2):
         self,
         circuit: QuantumCircuit,
         parameter_values: BindingsArray,
-        param_obs_map: dict[tuple[int, ...], set[str]],
-    ) -> list[QuantumCircuit]:
+        measurements: list[tuple[int, list[tuple]]],
+        meas_circuits: dict[tuple[int, bytes, bytes], QuantumCircuit],
+    ) -> tuple[list[QuantumCircuit], list[tuple | None], list[dict]]:
         """Bind the given circuit against each parameter value set, and add necessary measurements
         to each.
 
         Args:
             circuit: The (possibly parametric) circuit of interest.
             parameter_values: An array of parameter value sets that can be applied to the circuit.
-            param_obs_map: A mapping from locations in ``parameter_values`` to a sets of
+            measurements: The flat locations in ``parameter_values`` paired with the groups of
                 Pauli terms whose expectation values are required in those locations.
+            meas_circuits: The unrolled measurement circuits of all the bases of the
+                ``measurements``, keyed like ``_meas_cache``.
 
         Returns:
-            A flat list of circuits sufficient to measure all Pauli terms in the ``param_obs_map``
-            values at the corresponding ``parameter_values`` location, where requisite
-            book-keeping is stored as circuit metadata.
+            A flat list of circuits sufficient to measure all Pauli terms in the ``measurements``
+            at the corresponding ``parameter_values`` location, the keys identifying the
+            circuits if they are deduplicated, and the metadata of each measurement where
+            requisite book-keeping is stored.
         """
+        creg_names = {creg.name for creg in circuit.cregs}
+        # a flat view of the bindings array is indexed by the flat locations directly
+        flat_values = parameter_values.ravel()
+        deduplicate = self._options.deduplicate_circuits
         circuits = []
-        for param_index, pauli_strings in param_obs_map.items():
-            bound_circuit = parameter_values.bind(circuit, param_index)
-            # sort pauli_strings so that the order is deterministic
-            meas_paulis = PauliList(sorted(pauli_strings))
-            new_circuits = self._create_measurement_circuits(
-                bound_circuit, meas_paulis, param_index
-            )
-            circuits.extend(new_circuits)
-        return circuits
+        circuit_keys = []
+        metadata = []
+        # the index in circuits of each deduplicated circuit
+        circuit_indices: dict[tuple, int] = {}
+        for param_index, groups in measurements:
+            values_key = None
+            if deduplicate:
+                # the circuit of a measurement is identified by the parameter values and the basis
+                # before binding, so that the duplicates are neither bound nor composed
+                values_key = tuple(
+                    (params, values[param_index].tobytes())
+                    for params, values in flat_values.data.items()
+                )
+            # the bases of the measurements needing a new circuit
+            new_keys = []
+            for key, _, orig_ids, meas_paulis in groups:
+                circuit_key = None if values_key is None else (values_key, key)
+                if circuit_key is None or circuit_key not in circuit_indices:
+                    circuit_index = len(circuits) + len(new_keys)
+                    if circuit_key is not None:
+                        circuit_indices[circuit_key] = circuit_index
+                    new_keys.append(key)
+                    circuit_keys.append(circuit_key)
+                else:
+                    circuit_index = circuit_indices[circuit_key]
+                metadata.append(
+                    {
+                        "orig_ids": orig_ids,
+                        "meas_paulis": meas_paulis,
+                        "param_index": param_index,
+                        "circuit_index": circuit_index,
+                    }
+                )
+            if not new_keys:
+                continue
+
+            bound_circuit = flat_values.bind(circuit, (param_index,))
+            # the metadata is not used, so avoid deep copying it below
+            bound_circuit.metadata = {}
+            # combine measurement circuits
+            for i, key in enumerate(new_keys):
+                # the bound circuit is not needed once all the other measurements are combined,
+                # so the last measurement is composed onto it in place instead of onto a copy
+                if i < len(new_keys) - 1:
+                    circuit_copy = bound_circuit.copy()
+                else:
+                    circuit_copy = bound_circuit
+                meas_circuit = meas_circuits[key]
+                # meas_circuit is supposed to have a classical register whose name is different
+                # from those of the transpiled_circuit
+                clbits = meas_circuit.cregs[0]
+                if clbits.name in creg_names:
+                    raise QiskitError(
+                        "Classical register for measurements conflict with those of the input "
+                        f"circuit: {clbits}. "
+                        "Recommended to avoid register names starting with '__'."
+                    )
+                circuit_copy.add_register(clbits)
+                circuit_copy.compose(meas_circuit, clbits=clbits, inplace=True)
+                circuits.append(circuit_copy)
+        return circuits, circuit_keys, metadata
 
     def _calc_expval_map(
         self,
         counts: list[Counts],
         metadata: dict,
-    ) -> dict[tuple[tuple[int, ...], str], tuple[float, float]]:
+    ) -> dict[tuple[int, int], tuple[float, float]]:
         """Computes the map of expectation values.
 
         Args:
@@ -302,92 +522,138 @@ class BackendEstimatorV2(BaseEstimatorV2):
             metadata: The metadata.
 
         Returns:
-            The map of expectation values takes a pair of an index of the bindings array and
-            a pauli string as a key and returns the expectation value of the pauli string
-            with the the pub's circuit bound against the parameter value set in the index of
-            the bindings array.
+            The map of expectation values takes a pair of a flat index of the bindings array and
+            the index of a Pauli term in the pub's sorted Pauli terms as a key and returns the
+            expectation value of the Pauli term with the the pub's circuit bound against the
+            parameter value set in the index of the bindings array.
         """
-        expval_map: dict[tuple[tuple[int, ...], str], tuple[float, float]] = {}
+        expval_map: dict[tuple[int, int], tuple[float, float]] = {}
+        # group the measurements by the shape of their Pauli lists so that each group can be
+        # evaluated in a single batch
+        batches = defaultdict(list)
         for count, meta in zip(counts, metadata):
-            orig_paulis = meta["orig_paulis"]
             meas_paulis = meta["meas_paulis"]
-            param_index = meta["param_index"]
-            expvals, variances = _pauli_expval_with_variance(count, meas_paulis)
-            for pauli, expval, variance in zip(orig_paulis, expvals, variances):
-                expval_map[param_index, pauli.to_label()] = (expval, variance)
+            batches[len(meas_paulis), meas_paulis.num_qubits].append((count, meta))
+
+        for (_, num_qubits), batch in batches.items():
+            if num_qubits <= 64:
+                expvals, variances = _pauli_expval_with_variance_batch(
+                    [count for count, _ in batch], [meta["meas_paulis"] for _, meta in batch]
+                )
+            else:
+                expvals, variances = zip(
+                    *(
+                        _pauli_expval_with_variance(count, meta["meas_paulis"])
+                        for count, meta in batch
+                    )
+                )
+            for (_, meta), pauli_expvals, pauli_variances in zip(batch, expvals, variances):
+                param_index = meta["param_index"]
+                for pauli_id, expval, variance in zip(
+                    meta["orig_ids"].tolist(), pauli_expvals, pauli_variances
+                ):
+                    expval_map[param_index, pauli_id] = (expval, variance)
         return expval_map
 
-    def _create_measurement_circuits(
-        self, circuit: QuantumCircuit, observable: PauliList, param_index: tuple[int, ...]
-    ) -> list[QuantumCircuit]:
-        """Generate a list of circuits sufficient to estimate each of the given Paulis.
+    def _group_paulis(
+        self, num_qubits: int, observable: PauliList
+    ) -> list[tuple[tuple[int, bytes, bytes], Pauli, np.ndarray, PauliList]]:
+        """Divide Paulis into the groups measured by each measurement circuit.
 
         Paulis are divided into qubitwise-commuting subsets to reduce the total circuit count.
-        Metadata is attached to circuits in order to remember what each one measures, and
-        where it belongs in the output.
+        The same observable is typically measured at every binding of a pub, so the groups are
+        only computed once for each set of Pauli terms, and those of the last
+        ``_GROUP_CACHE_SIZE`` sets used are kept.
 
         Args:
-            circuit: The circuit of interest.
+            num_qubits: The number of qubits of the circuit of interest.
             observable: Which Pauli terms we would like to observe.
-            param_index: Where to put the data we estimate (only passed to metadata).
 
         Returns:
-            A list of circuits sufficient to estimate each of the given Paulis.
+            A list of the ``_meas_cache`` key of a measurement basis, the basis, the positions in
+            ``observable`` of the Paulis measured in that basis, and these Paulis restricted to
+            the measured qubits. The returned objects are shared and must not be modified.
         """
-        meas_circuits: list[QuantumCircuit] = []
+        group_key = (
+            self._options.abelian_grouping,
+            num_qubits,
+            observable.z.tobytes(),
+            observable.x.tobytes(),
+        )
+        groups = self._group_cache.get(group_key)
+        if groups is not None:
+            return groups
+
         if self._options.abelian_grouping:
-            for obs in observable.group_commuting(qubit_wise=True):
-                basis = Pauli((np.logical_or.reduce(obs.z), np.logical_or.reduce(obs.x)))
-                meas_circuit, indices = _measurement_circuit(circuit.num_qubits, basis)
-                paulis = PauliList.from_symplectic(
-                    obs.z[:, indices],
-                    obs.x[:, indices],
-                    obs.phase,
-                )
-                meas_circuit.metadata = {
-                    "orig_paulis": obs,
-                    "meas_paulis": paulis,
-                    "param_index": param_index,
-                }
-                meas_circuits.append(meas_circuit)
+            group_positions = [
+                np.array(positions)
+                for positions in observable._commuting_groups(qubit_wise=True).values()
+            ]
         else:
-            for basis in observable:
-                meas_circuit, indices = _measurement_circuit(circuit.num_qubits, basis)
-                obs = PauliList(basis)
-                paulis = PauliList.from_symplectic(
-                    obs.z[:, indices],
-                    obs.x[:, indices],
-                    obs.phase,
-                )
-                meas_circuit.metadata = {
-                    "orig_paulis": obs,
-                    "meas_paulis": paulis,
-                    "param_index": param_index,
-                }
-                meas_circuits.append(meas_circuit)
+            group_positions = [np.array([i]) for i in range(len(observable))]
+
+        groups = []
+        for positions in group_positions:
+            obs = observable[positions]
+            basis = _measurement_basis(obs)
+            indices = _measured_qubits(basis)
+            meas_paulis = PauliList.from_symplectic(
+                obs.z[:, indices],
+                obs.x[:, indices],
+                obs.phase,
+            )
+            key = (num_qubits, basis.z.tobytes(), basis.x.tobytes())
+            groups.append((key, basis, positions, meas_paulis))
+        self._group_cache.put(group_key, groups)
+        return groups
+
+    def _create_measurement_circuits(
+        self, bases: dict[tuple[int, bytes, bytes], Pauli]
+    ) -> dict[tuple[int, bytes, bytes], QuantumCircuit]:
+        """Build the measurement circuits of the given bases and add them to ``_meas_cache``.
+
+        The circuits are unrolled to the basis gates of the backend with a single run of the pass
+        manager. Only the last ``_MEAS_CACHE_SIZE`` bases used are kept in the cache.
+
+        Args:
+            bases: A mapping from the ``_meas_cache`` keys, starting with the number of qubits of
+                the circuit of interest, to the measurement bases.
 
+        Returns:
+            A mapping from the keys of ``bases`` to the unrolled measurement circuits.
+        """
+        meas_circuits = [_measurement_circuit(key[0], basis)[0] for key, basis in bases.items()]
         # unroll basis gates
         meas_circuits = self._passmanager.run(meas_circuits)
+        for key, meas_circuit in zip(bases, meas_circuits):
+            self._meas_cache.put(key, meas_circuit)
+        return dict(zip(bases, meas_circuits))
 
-        # combine measurement circuits
-        preprocessed_circuits = []
-        for meas_circuit in meas_circuits:
-            circuit_copy = circuit.copy()
-            # meas_circuit is supposed to have a classical register whose name is different from
-            # those of the transpiled_circuit
-            clbits = meas_circuit.cregs[0]
-            for creg in circuit_copy.cregs:
-                if clbits.name == creg.name:
-                    raise QiskitError(
-                        "Classical register for measurements conflict with those of the input "
-                        f"circuit: {clbits}. "
-                        "Recommended to avoid register names starting with '__'."
-                    )
-            circuit_copy.add_register(clbits)
-            circuit_copy.compose(meas_circuit, clbits=clbits, inplace=True)
-            circuit_copy.metadata = meas_circuit.metadata
-            preprocessed_circuits.append(circuit_copy)
-        return preprocessed_circuits
+
+def _map_pubs(function: Callable, *iterables: Sequence) -> list:
+    """Map a function over sequences of pubs and their data, concurrently if parallel execution
+    is enabled. The results are in the order of the pubs.
+    """
+    num_workers = min(len(iterables[0]), CPU_COUNT)
+    if should_run_in_parallel(num_workers):
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            return list(executor.map(function, *iterables))
+    return list(map(function, *iterables))
+
+
+def _measurement_basis(paulis: PauliList) -> Pauli:
+    """Return the Pauli whose non-identity terms are those of any of the given qubit-wise
+    commuting Paulis, i.e. the basis measuring all of them at once.
+    """
+    return Pauli((np.logical_or.reduce(paulis.z), np.logical_or.reduce(paulis.x)))
+
+
+def _measured_qubits(pauli: Pauli) -> np.ndarray:
+    """Return the indices of the qubits measured by the measurement circuit of a basis."""
+    qubit_indices = np.arange(pauli.num_qubits)[pauli.z | pauli.x]
+    if not np.any(qubit_indices):
+        qubit_indices = np.array([0])
+    return qubit_indices
 
 
 def _measurement_circuit(num_qubits: int, pauli: Pauli):
@@ -395,9 +661,7 @@ def _measurement_circuit(num_qubits: int, pauli: Pauli):
     # the first qubit.
     # Although such an operator can be optimized out by interpreting it as a constant (1),
     # this optimization requires changes in various methods. So it is left as future work.
-    qubit_indices = np.arange(pauli.num_qubits)[pauli.z | pauli.x]
-    if not np.any(qubit_indices):
-        qubit_indices = [0]
+    qubit_indices = _measured_qubits(pauli)
     meas_circuit = QuantumCircuit(
         QuantumRegister(num_qubits, "q"), ClassicalRegister(len(qubit_indices), f"__c_{pauli}")
     )
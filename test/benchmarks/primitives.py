@@ -0,0 +1,87 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,no-member
+# pylint: disable=attribute-defined-outside-init
+
+import numpy as np
+
+from qiskit.primitives.backend_estimator import (
+    _pauli_expval_with_variance,
+    _pauli_expval_with_variance_batch,
+    _paulis2inds,
+)
+from qiskit.primitives.backend_estimator_v2 import _measurement_basis
+from qiskit.quantum_info.operators.symplectic.random import random_pauli_list
+from qiskit.result import Counts
+
+
+def _random_counts(rng, nqubits, noutcomes):
+    outcomes = rng.choice(2**nqubits, size=noutcomes, replace=False)
+    return Counts(
+        {format(outcome, f"0{nqubits}b"): int(rng.integers(1, 100)) for outcome in outcomes}
+    )
+
+
+class Paulis2IndsBench:
+    params = ["2,1", "20,10", "60,40", "100,50"]
+    param_names = ["nqubits,length"]
+
+    def setup(self, nqubits_length):
+        (nqubits, length) = map(int, nqubits_length.split(","))
+        self.paulis = random_pauli_list(nqubits, length, seed=12)
+
+    def time_paulis2inds(self, _):
+        _paulis2inds(self.paulis)
+
+
+class MeasurementBasisBench:
+    params = ["4,3", "100,50", "500,200"]
+    param_names = ["nqubits,length"]
+
+    def setup(self, nqubits_length):
+        (nqubits, length) = map(int, nqubits_length.split(","))
+        self.paulis = random_pauli_list(nqubits, length, seed=12)
+
+    def time_measurement_basis(self, _):
+        _measurement_basis(self.paulis)
+
+
+class PauliExpvalBench:
+    params = ["2,1,4", "5,4,30", "10,4,1000", "20,10,200"]
+    param_names = ["nqubits,length,noutcomes"]
+
+    def setup(self, nqubits_length_noutcomes):
+        (nqubits, length, noutcomes) = map(int, nqubits_length_noutcomes.split(","))
+        rng = np.random.default_rng(12)
+        self.counts = _random_counts(rng, nqubits, noutcomes)
+        self.paulis = random_pauli_list(nqubits, length, seed=12)
+
+    def time_pauli_expval_with_variance(self, _):
+        _pauli_expval_with_variance(self.counts, self.paulis)
+
+
+class PauliExpvalBatchBench:
+    params = ["6,5,20,1000"]
+    param_names = ["nqubits,length,noutcomes,ncounts"]
+
+    def setup(self, nqubits_length_noutcomes_ncounts):
+        (nqubits, length, noutcomes, ncounts) = map(
+            int, nqubits_length_noutcomes_ncounts.split(",")
+        )
+        rng = np.random.default_rng(12)
+        self.counts = [_random_counts(rng, nqubits, noutcomes) for _ in range(ncounts)]
+        # the same Pauli list is measured in every counts dict, as at each binding of a pub
+        self.paulis = [random_pauli_list(nqubits, length, seed=12)] * ncounts
+
+    def time_pauli_expval_with_variance_batch(self, _):
+        _pauli_expval_with_variance_batch(self.counts, self.paulis)
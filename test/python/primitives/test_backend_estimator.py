@@ -21,9 +21,14 @@ from ddt import ddt
 from qiskit.circuit import QuantumCircuit
 from qiskit.circuit.library import RealAmplitudes
 from qiskit.primitives import BackendEstimator, EstimatorResult
+from qiskit.primitives.backend_estimator import (
+    _pauli_expval_with_variance,
+    _pauli_expval_with_variance_batch,
+)
 from qiskit.providers.fake_provider import Fake7QPulseV1, GenericBackendV2
 from qiskit.providers.backend_compat import BackendV2Converter
-from qiskit.quantum_info import SparsePauliOp
+from qiskit.quantum_info import PauliList, SparsePauliOp
+from qiskit.result import Counts
 from qiskit.transpiler import PassManager
 from qiskit.utils import optionals
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -454,6 +459,92 @@ class TestBackendEstimator(QiskitTestCase):
         result = estimator.run(qc, observable).result()
         self.assertAlmostEqual(result.values[0], 0, places=1)
 
+    @combine(num_qubits=[3, 64, 70])
+    def test_pauli_expval_with_variance(self, num_qubits):
+        """Test the expectation values and variances computed from counts"""
+        rng = np.random.default_rng(42)
+        paulis = PauliList(
+            ["".join(rng.choice(list("IXYZ"), size=num_qubits)) for _ in range(5)]
+            + ["I" * num_qubits]
+        )
+        outcomes = sorted({"".join(rng.choice(list("01"), size=num_qubits)) for _ in range(20)})
+        freqs = rng.integers(1, 100, size=len(outcomes))
+        # the measured register is the leftmost one, other registers are ignored
+        counts = Counts({f"{outcome} 01": int(freq) for outcome, freq in zip(outcomes, freqs)})
+
+        expvals, variances = _pauli_expval_with_variance(counts, paulis)
+
+        nonid = paulis.z | paulis.x
+        bits = np.array([[int(bit) for bit in reversed(outcome)] for outcome in outcomes])
+        signs = (-1) ** ((nonid[:, None, :] & bits[None, :, :]).sum(axis=2) % 2)
+        target = signs @ freqs / freqs.sum()
+        np.testing.assert_allclose(expvals, target)
+        np.testing.assert_allclose(variances, 1 - target**2)
+        self.assertEqual(expvals[-1], 1)
+
+        with self.subTest("counts from hexadecimal outcomes"):
+            hex_counts = Counts(
+                {hex(int(f"{outcome}01", 2)): int(freq) for outcome, freq in zip(outcomes, freqs)},
+                creg_sizes=[["c", 2], ["meas", num_qubits]],
+                memory_slots=num_qubits + 2,
+            )
+            expvals, variances = _pauli_expval_with_variance(hex_counts, paulis)
+            np.testing.assert_allclose(expvals, target)
+            np.testing.assert_allclose(variances, 1 - target**2)
+
+        with self.subTest("counts evaluated with a Python loop"):
+            with patch("qiskit.primitives.backend_estimator._EXPVAL_LOOP_SIZE", len(counts) * 6):
+                expvals, variances = _pauli_expval_with_variance(counts, paulis)
+            np.testing.assert_allclose(expvals, target)
+            np.testing.assert_allclose(variances, 1 - target**2)
+
+    def test_pauli_expval_with_variance_batch(self):
+        """Test the batched expectation values agree with those of each counts dict"""
+        rng = np.random.default_rng(42)
+        num_qubits = 5
+        counts_list = []
+        paulis_list = []
+        for num_outcomes in [1, 7, 3]:
+            outcomes = rng.choice(2**num_qubits, size=num_outcomes, replace=False)
+            counts_list.append(
+                Counts(
+                    {
+                        format(outcome, f"0{num_qubits}b"): int(rng.integers(1, 100))
+                        for outcome in outcomes
+                    }
+                )
+            )
+            paulis_list.append(
+                PauliList(["".join(rng.choice(list("IXYZ"), size=num_qubits)) for _ in range(4)])
+            )
+
+        expvals, variances = _pauli_expval_with_variance_batch(counts_list, paulis_list)
+
+        self.assertEqual(expvals.shape, (3, 4))
+        for i, (counts, paulis) in enumerate(zip(counts_list, paulis_list)):
+            target_expvals, target_variances = _pauli_expval_with_variance(counts, paulis)
+            np.testing.assert_allclose(expvals[i], target_expvals)
+            np.testing.assert_allclose(variances[i], target_variances)
+
+        with self.subTest("counts spanning several blocks"):
+            with patch("qiskit.primitives.backend_estimator._EXPVAL_BLOCK_SIZE", 8):
+                block_expvals, block_variances = _pauli_expval_with_variance_batch(
+                    counts_list, paulis_list
+                )
+            np.testing.assert_allclose(block_expvals, expvals)
+            np.testing.assert_allclose(block_variances, variances)
+
+        with self.subTest("counts measuring the same Pauli list"):
+            shared_expvals, shared_variances = _pauli_expval_with_variance_batch(
+                counts_list, [paulis_list[0]] * len(counts_list)
+            )
+            for i, counts in enumerate(counts_list):
+                target_expvals, target_variances = _pauli_expval_with_variance(
+                    counts, paulis_list[0]
+                )
+                np.testing.assert_allclose(shared_expvals[i], target_expvals)
+                np.testing.assert_allclose(shared_variances[i], target_variances)
+
 
 if __name__ == "__main__":
     unittest.main()
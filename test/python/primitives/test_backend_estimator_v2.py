@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import threading
 import unittest
 from test import QiskitTestCase, combine
 from unittest.mock import patch
@@ -21,16 +22,18 @@ from unittest.mock import patch
 import numpy as np
 from ddt import ddt
 
-from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.circuit import ClassicalRegister, Parameter, QuantumCircuit, QuantumRegister
 from qiskit.circuit.library import RealAmplitudes
+from qiskit.exceptions import QiskitError
 from qiskit.primitives import BackendEstimatorV2, StatevectorEstimator
+from qiskit.primitives.backend_estimator_v2 import _measurement_basis
 from qiskit.primitives.containers.bindings_array import BindingsArray
 from qiskit.primitives.containers.estimator_pub import EstimatorPub
 from qiskit.primitives.containers.observables_array import ObservablesArray
 from qiskit.providers.backend_compat import BackendV2Converter
 from qiskit.providers.basic_provider import BasicSimulator
 from qiskit.providers.fake_provider import Fake7QPulseV1, GenericBackendV2
-from qiskit.quantum_info import SparsePauliOp
+from qiskit.quantum_info import Pauli, PauliList, SparsePauliOp
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 from qiskit.utils import optionals
 
@@ -473,6 +476,254 @@ class TestBackendEstimatorV2(QiskitTestCase):
         np.testing.assert_allclose(result[0].data.evs, [-1.284366511861733], rtol=self._rtol)
         np.testing.assert_allclose(result[1].data.evs, [-1.284366511861733], rtol=self._rtol)
 
+    def test_measurement_circuit_cache(self):
+        """Test the measurement circuits of each basis are unrolled only once"""
+        backend = BasicSimulator()
+        pm = generate_preset_pass_manager(optimization_level=0, backend=backend)
+        qc = pm.run(RealAmplitudes(num_qubits=2, reps=2))
+        # Note: two qubit-wise commuting groups
+        op = SparsePauliOp.from_list([("IZ", 1), ("XI", 2), ("ZY", -1)]).apply_layout(qc.layout)
+        param_list = self._rng.random((3, qc.num_parameters))
+        estimator = BackendEstimatorV2(backend=backend, options=self._options)
+        target = StatevectorEstimator().run([(qc, op, param_list)]).result()
+        with patch.object(
+            estimator._passmanager, "run", wraps=estimator._passmanager.run
+        ) as run_mock:
+            result1 = estimator.run([(qc, op, param_list)]).result()
+            result2 = estimator.run([(qc, op, param_list)]).result()
+        self.assertEqual(run_mock.call_count, 1)
+        self.assertEqual(len(run_mock.call_args.args[0]), 2)
+        for result in [result1, result2]:
+            np.testing.assert_allclose(
+                result[0].data.evs, target[0].data.evs, rtol=self._rtol, atol=1e-1
+            )
+
+    def test_measurement_circuits_of_pub(self):
+        """Test the measurement circuits of all the bindings of a pub are unrolled at once"""
+        backend = BasicSimulator()
+        pm = generate_preset_pass_manager(optimization_level=0, backend=backend)
+        qc = pm.run(RealAmplitudes(num_qubits=2, reps=2))
+        ops = [
+            SparsePauliOp.from_list([("IZ", 1), ("XI", 2)]).apply_layout(qc.layout),
+            SparsePauliOp.from_list([("ZY", -1)]).apply_layout(qc.layout),
+        ]
+        param_list = self._rng.random((2, qc.num_parameters))
+        estimator = BackendEstimatorV2(backend=backend, options=self._options)
+        target = StatevectorEstimator().run([(qc, ops, param_list)]).result()
+        with patch.object(
+            estimator._passmanager, "run", wraps=estimator._passmanager.run
+        ) as run_mock:
+            result = estimator.run([(qc, ops, param_list)]).result()
+        self.assertEqual(run_mock.call_count, 1)
+        self.assertEqual(len(run_mock.call_args.args[0]), 2)
+        np.testing.assert_allclose(
+            result[0].data.evs, target[0].data.evs, rtol=self._rtol, atol=1e-1
+        )
+
+    def test_grouping_cache(self):
+        """Test the Pauli terms of an observable are grouped only once"""
+        backend = BasicSimulator()
+        pm = generate_preset_pass_manager(optimization_level=0, backend=backend)
+        qc = pm.run(RealAmplitudes(num_qubits=2, reps=2))
+        op = SparsePauliOp.from_list([("IZ", 1), ("XI", 2), ("ZY", -1)]).apply_layout(qc.layout)
+        param_list = self._rng.random((3, qc.num_parameters))
+        estimator = BackendEstimatorV2(backend=backend, options=self._options)
+        target = StatevectorEstimator().run([(qc, op, param_list)]).result()
+        with patch.object(
+            PauliList, "_commuting_groups", autospec=True, side_effect=PauliList._commuting_groups
+        ) as group_mock:
+            result1 = estimator.run([(qc, op, param_list)]).result()
+            result2 = estimator.run([(qc, op, param_list)]).result()
+        self.assertEqual(group_mock.call_count, 1)
+        for result in [result1, result2]:
+            np.testing.assert_allclose(
+                result[0].data.evs, target[0].data.evs, rtol=self._rtol, atol=1e-1
+            )
+        with self.subTest("abelian_grouping changed"):
+            estimator.options.abelian_grouping = False
+            result = estimator.run([(qc, op, param_list)]).result()
+            np.testing.assert_allclose(
+                result[0].data.evs, target[0].data.evs, rtol=self._rtol, atol=1e-1
+            )
+
+    def test_grouping_cache_size(self):
+        """Test the grouping cache only keeps the most recently used sets of Pauli terms"""
+        backend = BasicSimulator()
+        qc = QuantumCircuit(2)
+        qc.h(1)
+        ops = [SparsePauliOp(label) for label in ["IZ", "XI", "ZY"]]
+        with patch("qiskit.primitives.backend_estimator_v2._GROUP_CACHE_SIZE", 2):
+            estimator = BackendEstimatorV2(backend=backend, options=self._options)
+        for op in ops:
+            estimator.run([(qc, op)]).result()
+        self.assertEqual(len(estimator._group_cache), 2)
+        with patch.object(
+            PauliList,
+            "_commuting_groups",
+            autospec=True,
+            side_effect=PauliList._commuting_groups,
+        ) as group_mock:
+            # the last two are cached, and the first is grouped again
+            estimator.run([(qc, ops[2])]).result()
+            self.assertEqual(group_mock.call_count, 0)
+            result = estimator.run([(qc, ops[0])]).result()
+            self.assertEqual(group_mock.call_count, 1)
+        self.assertEqual(len(estimator._group_cache), 2)
+        np.testing.assert_allclose(result[0].data.evs, 1, atol=0.1)
+
+    def test_measurement_circuit_cache_size(self):
+        """Test the measurement circuit cache only keeps the most recently used bases"""
+        backend = BasicSimulator()
+        qc = QuantumCircuit(2)
+        qc.h(1)
+        # Note: three measurement bases, more than the cache holds
+        op = SparsePauliOp.from_list([("IZ", 1), ("IX", 2), ("IY", 3)])
+        with patch("qiskit.primitives.backend_estimator_v2._MEAS_CACHE_SIZE", 2):
+            estimator = BackendEstimatorV2(backend=backend, options=self._options)
+        target = StatevectorEstimator().run([(qc, op)]).result()
+        with patch.object(
+            estimator._passmanager, "run", wraps=estimator._passmanager.run
+        ) as run_mock:
+            result1 = estimator.run([(qc, op)]).result()
+            self.assertEqual(len(estimator._meas_cache), 2)
+            result2 = estimator.run([(qc, op)]).result()
+        self.assertEqual(len(estimator._meas_cache), 2)
+        # the evicted basis is unrolled again
+        self.assertEqual(run_mock.call_count, 2)
+        self.assertEqual(len(run_mock.call_args.args[0]), 1)
+        for result in [result1, result2]:
+            np.testing.assert_allclose(
+                result[0].data.evs, target[0].data.evs, rtol=self._rtol, atol=1e-1
+            )
+
+    @combine(num_qubits=[1, 3, 64, 70])
+    def test_measurement_basis(self, num_qubits):
+        """Test the measurement basis of qubit-wise commuting Paulis"""
+        # Y or I on each qubit
+        bits = self._rng.integers(2, size=(5, num_qubits), dtype=bool)
+        paulis = PauliList.from_symplectic(bits, bits)
+        basis = np.logical_or.reduce(bits)
+        self.assertEqual(_measurement_basis(paulis), Pauli((basis, basis)))
+        paulis = PauliList(["X" * num_qubits, "I" * num_qubits])
+        self.assertEqual(_measurement_basis(paulis), Pauli("X" * num_qubits))
+
+    def test_measurement_register_conflict(self):
+        """Test an error is raised if a register conflicts with the measurement register"""
+        qc = QuantumCircuit(QuantumRegister(1), ClassicalRegister(1, "__c_Z"))
+        qc.h(0)
+        estimator = BackendEstimatorV2(backend=BasicSimulator(), options=self._options)
+        with self.assertRaises(QiskitError):
+            estimator.run([(qc, SparsePauliOp("Z"))]).result()
+
+    @combine(backend=BACKENDS, abelian_grouping=[True, False])
+    def test_stds(self, backend, abelian_grouping):
+        """Test the standard errors combine the variances of each Pauli term"""
+        qc = QuantumCircuit(2)
+        qc.x(1)
+        pm = generate_preset_pass_manager(optimization_level=0, backend=backend)
+        qc = pm.run(qc)
+        # ZI and IZ are deterministic and IX has unit variance
+        op = SparsePauliOp.from_list([("ZI", 1), ("IZ", 2), ("IX", 3)]).apply_layout(qc.layout)
+        estimator = BackendEstimatorV2(backend=backend, options=self._options)
+        estimator.options.abelian_grouping = abelian_grouping
+        result = estimator.run([(qc, [op, op[:2]])]).result()
+        np.testing.assert_allclose(result[0].data.evs, [1, 1], atol=0.1)
+        np.testing.assert_allclose(result[0].data.stds, [3 * self._precision, 0], atol=1e-4)
+
+    def _run_with_threads(self, backend, pubs, parallel):
+        """Run the pubs and record the threads running the pubs and the pass manager"""
+        estimator = BackendEstimatorV2(backend=backend, options=self._options)
+        run_pubs, run_passmanager = estimator._run_pubs, estimator._passmanager.run
+        threads = {}
+
+        def _run_pubs(*args):
+            threads["run_pubs"] = threading.current_thread()
+            return run_pubs(*args)
+
+        def _run_passmanager(circuits):
+            threads.setdefault("passmanager", set()).add(threading.current_thread())
+            return run_passmanager(circuits)
+
+        with patch(
+            "qiskit.primitives.backend_estimator_v2.should_run_in_parallel",
+            return_value=parallel,
+        ), patch("qiskit.primitives.backend_estimator_v2.CPU_COUNT", 2), patch.object(
+            estimator, "_run_pubs", side_effect=_run_pubs
+        ), patch.object(
+            estimator._passmanager, "run", side_effect=_run_passmanager
+        ):
+            result = estimator.run(pubs).result()
+        return result, threads
+
+    def test_parallel_preprocessing(self):
+        """Test the pubs preprocessed in threads keep their order and match the serial results"""
+        backend = BasicSimulator()
+        pm = generate_preset_pass_manager(optimization_level=0, backend=backend)
+        psi1, psi2 = pm.run(list(self.psi))
+        hamiltonian1, hamiltonian2, hamiltonian3 = (
+            op.apply_layout(psi1.layout) for op in self.hamiltonian
+        )
+        theta1, theta2, theta3 = self.theta
+        pubs = [
+            (psi1, hamiltonian1, [theta1]),
+            (psi2, [hamiltonian2, hamiltonian3], [theta2]),
+            (psi1, [hamiltonian1, hamiltonian3], [theta1, theta3]),
+        ]
+        results = {}
+        for parallel in [False, True]:
+            results[parallel], threads = self._run_with_threads(backend, pubs, parallel)
+            # the pass manager is not thread safe, so it only runs on the thread of the pubs
+            self.assertEqual(threads["passmanager"], {threads["run_pubs"]})
+        for serial_result, parallel_result in zip(results[False], results[True]):
+            np.testing.assert_array_equal(parallel_result.data.evs, serial_result.data.evs)
+            np.testing.assert_array_equal(parallel_result.data.stds, serial_result.data.stds)
+        target = StatevectorEstimator().run(pubs).result()
+        for pub_result, target_result in zip(results[True], target):
+            np.testing.assert_allclose(
+                pub_result.data.evs, target_result.data.evs, rtol=self._rtol, atol=1e-1
+            )
+
+    @combine(deduplicate_circuits=[True, False])
+    def test_duplicate_circuits(self, deduplicate_circuits):
+        """Test identical bound circuits are only run once if deduplicate_circuits is enabled"""
+        backend = BasicSimulator()
+        pm = generate_preset_pass_manager(optimization_level=0, backend=backend)
+        qc = pm.run(RealAmplitudes(num_qubits=2, reps=2))
+        # Note: two qubit-wise commuting groups
+        op = SparsePauliOp.from_list([("IZ", 1), ("XI", 2), ("ZY", -1)]).apply_layout(qc.layout)
+        param_list = self._rng.random(qc.num_parameters)
+        # Note: without a seed, so that the circuits of a seeded run do not get identical counts
+        estimator = BackendEstimatorV2(
+            backend=backend,
+            options={
+                "default_precision": self._precision,
+                "deduplicate_circuits": deduplicate_circuits,
+            },
+        )
+        target = StatevectorEstimator().run([(qc, op, param_list)]).result()
+        with patch.object(backend, "run", wraps=backend.run) as run_mock:
+            result = estimator.run(
+                [
+                    (qc, op, [param_list] * 3),
+                    (qc, [op, op], param_list),
+                    (qc.copy(), op, param_list),
+                ]
+            ).result()
+        self.assertEqual(run_mock.call_count, 1)
+        # the observables of a parameter value set are always measured by the same circuits, and
+        # the last pub binds the same values as the others, but to a different circuit object
+        self.assertEqual(len(run_mock.call_args.args[0]), 4 if deduplicate_circuits else 10)
+        for pub_result in result:
+            np.testing.assert_allclose(
+                pub_result.data.evs, target[0].data.evs[()], rtol=self._rtol, atol=1e-1
+            )
+        # the repeated parameter values are independent estimates unless deduplicated
+        evs = result[0].data.evs
+        if deduplicate_circuits:
+            np.testing.assert_array_equal(evs, evs[0])
+        else:
+            self.assertGreater(len(np.unique(evs)), 1)
+
 
 if __name__ == "__main__":
     unittest.main()